@@ -5,14 +5,28 @@
 """
 
 import pygame
+import numpy as np
 import math
+import queue
 import random
+import threading
 import time
 from logger import (
     log_error, log_info, log_game_start,
     log_game_completion, log_game_aborted
 )
 
+# Numba необязательна: без нее используются версии на Python и NumPy
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Заменяет декоратор numba.njit, если Numba не установлена."""
+        return lambda func: func
+
 # Инициализация Pygame
 pygame.init()
 
@@ -36,7 +50,20 @@ MAX_DEPTH = 20
 ROTATION_SPEED = 0.04
 MINIMAP_SIZE = 150
 WALL_HEIGHT_MULTIPLIER = 5
-RAY_STEP_SIZE = 0.02
+# Число лучей на кадр: узкая полоса 3D вида растягивается на всю ширину окна
+RAY_COLS = 200
+
+# Смещения лучей столбцов относительно направления взгляда постоянны.
+# Косинус смещения также служит поправкой на эффект "рыбьего глаза".
+COLUMN_OFFSETS = np.linspace(-HALF_FOV, HALF_FOV, RAY_COLS, endpoint=False)
+COS_OFFSETS = np.cos(COLUMN_OFFSETS)
+SIN_OFFSETS = np.sin(COLUMN_OFFSETS)
+
+# Делители яркости стены по каналам RGB: каждый третий столбец
+# подкрашивается в свой канал, остальные каналы приглушаются втрое
+WALL_TINT_DIVISORS = np.array(
+    [[1, 3, 3], [3, 1, 3], [3, 3, 1]]
+)[np.arange(RAY_COLS) % 3]
 
 # Настройки сложности
 EASY_CONFIG = {
@@ -58,44 +85,113 @@ HARD_CONFIG = {
 }
 
 
+@njit(cache=True)
+def _generate_maze_nb(size, seed):
+    """Генерирует лабиринт в скомпилированном Numba коде."""
+    np.random.seed(seed)
+    directions = ((0, 2), (2, 0), (0, -2), (-2, 0))
+
+    # Создаем сетку, где все клетки - стены
+    maze = np.ones((size, size), dtype=np.uint8)
+
+    # Начинаем с центральной точки
+    start_x, start_y = size // 2, size // 2
+    maze[start_y, start_x] = 0
+
+    # Frontier клетки хранятся в заранее выделенном массиве
+    # строками (x, y, parent_x, parent_y)
+    frontiers = np.empty((4 * size * size, 4), dtype=np.int32)
+    n_frontiers = 0
+
+    for dx, dy in directions:
+        nx, ny = start_x + dx, start_y + dy
+        if 0 <= nx < size and 0 <= ny < size:
+            frontiers[n_frontiers, 0] = nx
+            frontiers[n_frontiers, 1] = ny
+            frontiers[n_frontiers, 2] = start_x
+            frontiers[n_frontiers, 3] = start_y
+            n_frontiers += 1
+
+    while n_frontiers > 0:
+        # Берем случайную frontier клетку и ставим на ее место последнюю
+        idx = np.random.randint(0, n_frontiers)
+        fx = frontiers[idx, 0]
+        fy = frontiers[idx, 1]
+        px = frontiers[idx, 2]
+        py = frontiers[idx, 3]
+        n_frontiers -= 1
+        frontiers[idx] = frontiers[n_frontiers]
+
+        if maze[fy, fx] == 1:
+            maze[fy, fx] = 0
+            maze[(fy + py) // 2, (fx + px) // 2] = 0
+
+            for dx, dy in directions:
+                nx, ny = fx + dx, fy + dy
+                if (0 <= nx < size and 0 <= ny < size
+                        and maze[ny, nx] == 1):
+                    frontiers[n_frontiers, 0] = nx
+                    frontiers[n_frontiers, 1] = ny
+                    frontiers[n_frontiers, 2] = fx
+                    frontiers[n_frontiers, 3] = fy
+                    n_frontiers += 1
+
+    # Создаем вход и выход
+    maze[1, 1] = 0
+    maze[size - 2, size - 2] = 0
+    return maze
+
+
+def _generate_maze_py(size):
+    """Генерирует лабиринт на чистом Python."""
+    # Создаем сетку, где все клетки - стены
+    maze = [[1 for _ in range(size)] for _ in range(size)]
+
+    # Начинаем с центральной точки
+    start_x, start_y = size // 2, size // 2
+    maze[start_y][start_x] = 0
+
+    # Список frontier клеток (тех, что можно расширять)
+    frontiers = []
+
+    # Добавляем соседей начальной точки
+    for dx, dy in [(0, 2), (2, 0), (0, -2), (-2, 0)]:
+        nx, ny = start_x + dx, start_y + dy
+        if 0 <= nx < size and 0 <= ny < size:
+            frontiers.append((nx, ny, start_x, start_y))
+
+    while frontiers:
+        # Берем случайную frontier клетку: меняем ее местами с последней,
+        # чтобы pop() с конца списка не сдвигал остальные элементы
+        idx = random.randrange(len(frontiers))
+        frontiers[idx], frontiers[-1] = frontiers[-1], frontiers[idx]
+        fx, fy, px, py = frontiers.pop()
+
+        if maze[fy][fx] == 1:
+            maze[fy][fx] = 0
+            maze[(fy + py) // 2][(fx + px) // 2] = 0
+
+            for dx, dy in [(0, 2), (2, 0), (0, -2), (-2, 0)]:
+                nx, ny = fx + dx, fy + dy
+                if (0 <= nx < size and 0 <= ny < size
+                        and maze[ny][nx] == 1):
+                    frontiers.append((nx, ny, fx, fy))
+
+    # Создаем вход и выход
+    maze[1][1] = 0
+    maze[size-2][size-2] = 0
+
+    return np.array(maze, dtype=np.uint8)
+
+
 def generate_maze(size):
     """Генерация случайного лабиринта с помощью алгоритма."""
     try:
-        # Создаем сетку, где все клетки - стены
-        maze = [[1 for _ in range(size)] for _ in range(size)]
-
-        # Начинаем с центральной точки
-        start_x, start_y = size // 2, size // 2
-        maze[start_y][start_x] = 0
-
-        # Список frontier клеток (тех, что можно расширять)
-        frontiers = []
-
-        # Добавляем соседей начальной точки
-        for dx, dy in [(0, 2), (2, 0), (0, -2), (-2, 0)]:
-            nx, ny = start_x + dx, start_y + dy
-            if 0 <= nx < size and 0 <= ny < size:
-                frontiers.append((nx, ny, start_x, start_y))
-
-        while frontiers:
-            # Берем случайную frontier клетку
-            fx, fy, px, py = frontiers.pop(
-                random.randint(0, len(frontiers) - 1)
-            )
-
-            if maze[fy][fx] == 1:
-                maze[fy][fx] = 0
-                maze[(fy + py) // 2][(fx + px) // 2] = 0
-
-                for dx, dy in [(0, 2), (2, 0), (0, -2), (-2, 0)]:
-                    nx, ny = fx + dx, fy + dy
-                    if (0 <= nx < size and 0 <= ny < size
-                            and maze[ny][nx] == 1):
-                        frontiers.append((nx, ny, fx, fy))
-
-        # Создаем вход и выход
-        maze[1][1] = 0
-        maze[size-2][size-2] = 0
+        if NUMBA_AVAILABLE:
+            # Зерно берется из random, чтобы random.seed влиял и на Numba
+            maze = _generate_maze_nb(size, random.randrange(2**31))
+        else:
+            maze = _generate_maze_py(size)
 
         log_info(f"Лабиринт размером {size}x{size} успешно сгенерирован")
         return maze
@@ -103,15 +199,253 @@ def generate_maze(size):
     except Exception as e:
         log_error("Ошибка при генерации лабиринта", e)
         # Возвращаем простой лабиринт в случае ошибки
-        simple_maze = [[0 for _ in range(size)] for _ in range(size)]
-        for i in range(size):
-            simple_maze[0][i] = 1
-            simple_maze[size-1][i] = 1
-            simple_maze[i][0] = 1
-            simple_maze[i][size-1] = 1
+        simple_maze = np.zeros((size, size), dtype=np.uint8)
+        simple_maze[0, :] = 1
+        simple_maze[-1, :] = 1
+        simple_maze[:, 0] = 1
+        simple_maze[:, -1] = 1
         return simple_maze
 
 
+def create_occupancy_grid(maze):
+    """Возвращает сетку занятости для raycasting: лабиринт в рамке из стен.
+
+    Луч, покидающий лабиринт, упирается в рамку на той же границе, где
+    раньше останавливался по проверке выхода за карту, поэтому в циклах
+    лучей такая проверка не нужна. Координаты в сетке сдвинуты на 1.
+    """
+    return np.pad(maze, 1, mode='constant', constant_values=1)
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _cast_ray_nb(player_x, player_y, ray_cos, ray_sin, grid):
+    """Бросает один луч по клеткам сетки (DDA) и возвращает расстояние."""
+    map_x, map_y = int(player_x), int(player_y)
+
+    # Длина луча между соседними линиями сетки по каждой оси
+    delta_x = abs(1.0 / ray_cos) if ray_cos != 0.0 else 1e30
+    delta_y = abs(1.0 / ray_sin) if ray_sin != 0.0 else 1e30
+
+    # Направление шага и длина луча до первой линии сетки
+    if ray_cos < 0:
+        step_x = -1
+        side_x = (player_x - map_x) * delta_x
+    else:
+        step_x = 1
+        side_x = (map_x + 1.0 - player_x) * delta_x
+    if ray_sin < 0:
+        step_y = -1
+        side_y = (player_y - map_y) * delta_y
+    else:
+        step_y = 1
+        side_y = (map_y + 1.0 - player_y) * delta_y
+
+    wall_distance = 0.0
+
+    while wall_distance < MAX_DEPTH:
+        # Переходим в соседнюю клетку через ближайшую линию сетки
+        if side_x < side_y:
+            wall_distance = side_x
+            side_x += delta_x
+            map_x += step_x
+        else:
+            wall_distance = side_y
+            side_y += delta_y
+            map_y += step_y
+
+        if grid[map_y, map_x] == 1:
+            break
+
+    return min(wall_distance, MAX_DEPTH)
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _cast_rays_nb(player_x, player_y, ray_cos, ray_sin, grid):
+    """Бросает луч для каждого направления в скомпилированном Numba коде.
+
+    Лучи обходятся по одному: число шагов DDA у каждого луча свое.
+    Ядро отпускает GIL, поэтому считается в потоке RaycastWorker
+    параллельно с главным циклом.
+    """
+    distances = np.empty(ray_cos.shape[0], dtype=np.float64)
+    for i in range(ray_cos.shape[0]):
+        distances[i] = _cast_ray_nb(
+            player_x, player_y, ray_cos[i], ray_sin[i], grid
+        )
+    return distances
+
+
+def _cast_rays_np(player_x, player_y, ray_cos, ray_sin, grid):
+    """Бросает все лучи одновременно векторными операциями NumPy (DDA).
+
+    Остановившийся луч остается в клетке стены, а остальные лучи
+    продолжают движение.
+    """
+    n_rays = ray_cos.shape[0]
+
+    # Длина луча между соседними линиями сетки по каждой оси
+    delta_x = np.full(n_rays, 1e30)
+    delta_y = np.full(n_rays, 1e30)
+    np.divide(1.0, np.abs(ray_cos), out=delta_x, where=ray_cos != 0)
+    np.divide(1.0, np.abs(ray_sin), out=delta_y, where=ray_sin != 0)
+
+    # Направление шага и длина луча до первой линии сетки
+    map_x = np.full(n_rays, int(player_x), dtype=np.int32)
+    map_y = np.full(n_rays, int(player_y), dtype=np.int32)
+    step_x = np.where(ray_cos < 0, -1, 1).astype(np.int32)
+    step_y = np.where(ray_sin < 0, -1, 1).astype(np.int32)
+    side_x = np.where(
+        ray_cos < 0, player_x - map_x, map_x + 1.0 - player_x
+    ) * delta_x
+    side_y = np.where(
+        ray_sin < 0, player_y - map_y, map_y + 1.0 - player_y
+    ) * delta_y
+
+    distances = np.full(n_rays, float(MAX_DEPTH))
+    active = np.ones(n_rays, dtype=bool)
+
+    # За это число шагов любой луч доходит до рамки сетки
+    for _ in range(grid.shape[0] + grid.shape[1]):
+        step_on_x = side_x < side_y
+        move_x = step_on_x & active
+        move_y = ~step_on_x & active
+        ray_distance = np.where(step_on_x, side_x, side_y)
+        side_x += np.where(move_x, delta_x, 0.0)
+        side_y += np.where(move_y, delta_y, 0.0)
+        map_x += np.where(move_x, step_x, 0)
+        map_y += np.where(move_y, step_y, 0)
+
+        hit = (grid[map_y, map_x] == 1) | (ray_distance >= MAX_DEPTH)
+
+        stopped = active & hit
+        distances[stopped] = np.minimum(ray_distance[stopped], MAX_DEPTH)
+        active &= ~hit
+
+        if not active.any():
+            break
+
+    return distances
+
+
+def cast_rays(player_x, player_y, player_angle, grid):
+    """Бросает RAY_COLS лучей по полю зрения и возвращает их расстояния.
+
+    grid - сетка занятости из create_occupancy_grid.
+    """
+    # Направления лучей по формулам сложения углов, без тригонометрии
+    # для каждого столбца
+    cos_a = math.cos(player_angle)
+    sin_a = math.sin(player_angle)
+    ray_cos = cos_a * COS_OFFSETS - sin_a * SIN_OFFSETS
+    ray_sin = sin_a * COS_OFFSETS + cos_a * SIN_OFFSETS
+
+    # Переводим положение игрока в координаты сетки с рамкой
+    if NUMBA_AVAILABLE:
+        return _cast_rays_nb(
+            player_x + 1, player_y + 1, ray_cos, ray_sin, grid
+        )
+    return _cast_rays_np(player_x + 1, player_y + 1, ray_cos, ray_sin, grid)
+
+
+class RaycastWorker:
+    """Фоновый поток, который считает расстояния лучей для 3D вида.
+
+    Главный цикл отправляет последнее положение игрока и забирает готовые
+    расстояния, не дожидаясь их. Очереди хранят по одному элементу:
+    устаревший запрос или результат вытесняется новым. Ошибка расчета
+    передается через очередь результатов и поднимается в poll().
+    """
+
+    def __init__(self, grid):
+        """Запускает поток raycasting для сетки занятости grid."""
+        self.grid = grid
+        self.requests = queue.Queue(maxsize=1)
+        self.results = queue.Queue(maxsize=1)
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    @staticmethod
+    def _put_latest(target_queue, item):
+        """Кладет элемент в очередь, вытесняя из нее устаревший."""
+        try:
+            target_queue.get_nowait()
+        except queue.Empty:
+            pass
+        target_queue.put_nowait(item)
+
+    def _run(self):
+        """Обрабатывает запросы, пока не получит None."""
+        while True:
+            state = self.requests.get()
+            if state is None:
+                break
+            try:
+                result = cast_rays(*state, self.grid)
+            except Exception as e:
+                result = e
+            self._put_latest(self.results, result)
+
+    def submit(self, player_x, player_y, player_angle):
+        """Отправляет положение игрока на расчет."""
+        self._put_latest(self.requests, (player_x, player_y, player_angle))
+
+    def poll(self):
+        """Возвращает готовые расстояния или None, если их еще нет.
+
+        Исключение из потока raycasting поднимается здесь, в главном потоке.
+        """
+        try:
+            result = self.results.get_nowait()
+        except queue.Empty:
+            return None
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def stop(self):
+        """Останавливает поток и дожидается его завершения."""
+        self._put_latest(self.requests, None)
+        self.thread.join()
+
+
+def create_minimap_surface(maze, exit_x, exit_y):
+    """Рисует статичную часть мини-карты (клетки и выход) на поверхность."""
+    map_size = maze.shape[0]
+    cell_size = MINIMAP_SIZE // map_size
+    surface = pygame.Surface((MINIMAP_SIZE, MINIMAP_SIZE))
+
+    # Фон мини-карты
+    surface.fill((40, 40, 40))
+
+    # Поверхность блокируется один раз на все вызовы рисования клеток
+    surface.lock()
+
+    # Пол рисуется одним прямоугольником, стены - по списку клеток
+    grid_size = map_size * cell_size
+    pygame.draw.rect(surface, BLACK, (0, 0, grid_size, grid_size))
+    for y, x in np.argwhere(maze == 1):
+        pygame.draw.rect(
+            surface, WHITE,
+            (x * cell_size, y * cell_size, cell_size, cell_size)
+        )
+
+    # Рамки клеток: по две линии сетки на каждую строку и столбец
+    grid_end = grid_size - 1
+    for i in range(map_size):
+        for edge in (i * cell_size, (i + 1) * cell_size - 1):
+            pygame.draw.line(surface, GRAY, (edge, 0), (edge, grid_end))
+            pygame.draw.line(surface, GRAY, (0, edge), (grid_end, edge))
+
+    # Рисуем выход зеленым цветом
+    pygame.draw.rect(
+        surface, GREEN,
+        (exit_x * cell_size, exit_y * cell_size, cell_size, cell_size)
+    )
+
+    surface.unlock()
+    return surface
+
+
 def run_game(difficulty, player_name):
     """Запускает игру с заданной сложностью и возвращает время прохождения."""
     try:
@@ -123,6 +457,11 @@ def run_game(difficulty, player_name):
         else:  # hard
             config = HARD_CONFIG
 
+        # Параметры сложности читаются из словаря один раз
+        map_size = config['map_size']
+        move_speed = config['move_speed']
+        show_minimap = config['show_minimap']
+
         screen = pygame.display.set_mode((WIDTH, HEIGHT))
         pygame.display.set_caption(
             f"Лабиринт - {player_name} - {difficulty}"
@@ -131,256 +470,210 @@ def run_game(difficulty, player_name):
         log_game_start(player_name, difficulty)
 
         # Генерация лабиринта
-        maze = generate_maze(config['map_size'])
-        exit_x, exit_y = config['map_size'] - 2, config['map_size'] - 2
+        # Лабиринт хранится непрерывным массивом uint8 для всех горячих путей
+        maze = np.ascontiguousarray(
+            generate_maze(map_size), dtype=np.uint8
+        )
+        occupancy_grid = create_occupancy_grid(maze)
+
+        # Буферы кадра 3D вида: потолок и пол не меняются между кадрами
+        frame = np.empty((RAY_COLS, HEIGHT, 3), dtype=np.uint8)
+        backdrop = np.empty_like(frame)
+        backdrop[:, :HEIGHT // 2] = DARK_GRAY
+        backdrop[:, HEIGHT // 2:] = BROWN
+        rows = np.arange(HEIGHT)
+        strip_surface = pygame.Surface((RAY_COLS, HEIGHT))
+        # Последний кадр 3D вида, из него восстанавливается фон под HUD
+        view_surface = pygame.Surface((WIDTH, HEIGHT))
+        # Область мини-карты и информации, которая обновляется без 3D вида
+        hud_rect = pygame.Rect(0, 0, MINIMAP_SIZE + 40, MINIMAP_SIZE + 120)
+        exit_x, exit_y = map_size - 2, map_size - 2
+
+        # Лабиринт не меняется, поэтому мини-карта рисуется один раз
+        if show_minimap:
+            minimap_surface = create_minimap_surface(maze, exit_x, exit_y)
+            cell_size = MINIMAP_SIZE // map_size
 
         # Настройки игрока
         player_x, player_y = 1.5, 1.5
         player_angle = 0
 
+        # Шрифты и неизменные надписи создаются один раз за игру
+        font_small = pygame.font.Font(None, 24)
+        font_medium = pygame.font.Font(None, 36)
+
+        info_surfaces = [
+            font_small.render(f"Игрок: {player_name}", True, WHITE),
+            font_small.render(f"Сложность: {difficulty}", True, WHITE),
+            None,  # Таймер
+            font_small.render(f"Цель: ({exit_x}, {exit_y})", True, WHITE)
+        ]
+        timer_text = None
+
+        controls = [
+            "W/UP - вперед",
+            "S/DOWN - назад",
+            "A/LEFT - поворот влево",
+            "D/RIGHT - поворот вправо",
+            "Q/E - стрейф",
+            "ESC - выход в меню"
+        ]
+        control_surfaces = [
+            font_small.render(text, True, WHITE) for text in controls
+        ]
+
         # Таймер
         start_time = time.time()
         completion_time = 0
 
-        def cast_ray(angle):
-            """Бросает луч и возвращает расстояние до стены."""
-            try:
-                ray_x, ray_y = player_x, player_y
-                ray_cos = math.cos(angle) * RAY_STEP_SIZE
-                ray_sin = math.sin(angle) * RAY_STEP_SIZE
-
-                wall_distance = 0
-                wall_hit = False
-
-                while not wall_hit and wall_distance < MAX_DEPTH:
-                    ray_x += ray_cos
-                    ray_y += ray_sin
-                    wall_distance = math.sqrt(
-                        (ray_x - player_x)**2 + (ray_y - player_y)**2
-                    )
+        def draw_3d_view(distances):
+            """Отрисовывает 3D вид по расстояниям, найденным raycasting."""
+            corrected_distances = distances * COS_OFFSETS
+            wall_heights = np.minimum(
+                (HEIGHT / (corrected_distances + 0.0001)).astype(np.int32),
+                HEIGHT * WALL_HEIGHT_MULTIPLIER
+            )
+            wall_tops = (HEIGHT - wall_heights) // 2
+            wall_bottoms = wall_tops + wall_heights
+
+            # Цвет стены по таблице оттенков столбцов, без ветвлений
+            color_intensity = np.clip(255 - distances * 20, 50, 255)
+            wall_colors = (
+                color_intensity[:, None] // WALL_TINT_DIVISORS
+            ).astype(np.uint8)
+
+            wall_mask = (
+                (rows >= wall_tops[:, None]) &
+                (rows <= wall_bottoms[:, None])
+            )
 
-                    map_x, map_y = int(ray_x), int(ray_y)
-                    if (0 <= map_x < config['map_size'] and
-                            0 <= map_y < config['map_size']):
-                        if maze[map_y][map_x] == 1:
-                            wall_hit = True
-                    else:
-                        break
+            # Собираем кадр целиком и выводим его одной операцией
+            np.copyto(frame, backdrop)
+            np.copyto(frame, wall_colors[:, None, :],
+                      where=wall_mask[:, :, None])
+            pygame.surfarray.blit_array(strip_surface, frame)
+            pygame.transform.scale(strip_surface, (WIDTH, HEIGHT),
+                                   view_surface)
+            screen.blit(view_surface, (0, 0))
 
-                return wall_distance
-            except Exception as e:
-                log_error("Ошибка в raycasting", e)
-                return MAX_DEPTH
+        def draw_minimap():
+            """Отрисовывает мини-карту и информацию."""
+            nonlocal timer_text
 
-        def draw_3d_view():
-            """Отрисовывает 3D вид с помощью raycasting."""
-            try:
-                screen.fill(BLACK)
+            if not show_minimap:
+                return
+
+            # Статичная часть карты нарисована заранее
+            screen.blit(minimap_surface, (10, 10))
+
+            # Рисуем игрока
+            player_minimap_x = 10 + int(player_x * cell_size)
+            player_minimap_y = 10 + int(player_y * cell_size)
+            pygame.draw.circle(
+                screen, RED, (player_minimap_x, player_minimap_y), 4
+            )
+
+            # Рисуем направление взгляда
+            direction_x = (
+                player_minimap_x + math.cos(player_angle) * 15
+            )
+            direction_y = (
+                player_minimap_y + math.sin(player_angle) * 15
+            )
+            pygame.draw.line(
+                screen, GREEN,
+                (player_minimap_x, player_minimap_y),
+                (direction_x, direction_y), 2
+            )
+
+            # Надпись таймера перерисовывается, только когда меняется текст
+            text = f"Время: {time.time() - start_time:.1f}с"
+            if text != timer_text:
+                timer_text = text
+                info_surfaces[2] = font_small.render(text, True, WHITE)
 
-                # Рисуем пол и потолок
-                pygame.draw.rect(screen, DARK_GRAY, (0, 0, WIDTH, HEIGHT // 2))
-                pygame.draw.rect(
-                    screen, BROWN, (0, HEIGHT // 2, WIDTH, HEIGHT // 2)
+            # Информация
+            for i, text_surface in enumerate(info_surfaces):
+                screen.blit(
+                    text_surface, (10, MINIMAP_SIZE + 20 + i * 25)
                 )
 
-                # Бросаем лучи для каждого столбца экрана
-                for column in range(WIDTH):
-                    ray_angle = (
-                        player_angle - HALF_FOV + (column / WIDTH) * FOV
-                    )
-                    ray_angle %= 2 * math.pi
+        def handle_movement():
+            """Обрабатывает движение игрока и сообщает, сдвинулся ли он."""
+            nonlocal player_x, player_y, player_angle
 
-                    distance = cast_ray(ray_angle)
-                    corrected_distance = distance * math.cos(
-                        player_angle - ray_angle
-                    )
-                    wall_height = min(
-                        int(HEIGHT / (corrected_distance + 0.0001)),
-                        HEIGHT * WALL_HEIGHT_MULTIPLIER
-                    )
-                    wall_top = (HEIGHT - wall_height) // 2
-                    wall_bottom = wall_top + wall_height
+            previous_state = (player_x, player_y, player_angle)
+            keys = pygame.key.get_pressed()
 
-                    color_intensity = min(255, max(50, 255 - distance * 20))
+            # Направление взгляда; стрейф идет перпендикулярно ему
+            cos_a = math.cos(player_angle)
+            sin_a = math.sin(player_angle)
 
-                    if column % 3 == 0:
-                        wall_color = (
-                            color_intensity,
-                            color_intensity // 3,
-                            color_intensity // 3
-                        )
-                    elif column % 3 == 1:
-                        wall_color = (
-                            color_intensity // 3,
-                            color_intensity,
-                            color_intensity // 3
-                        )
-                    else:
-                        wall_color = (
-                            color_intensity // 3,
-                            color_intensity // 3,
-                            color_intensity
-                        )
+            move_x, move_y = 0, 0
 
-                    pygame.draw.line(
-                        screen, wall_color, (column, wall_top),
-                        (column, wall_bottom), 2
-                    )
-            except Exception as e:
-                log_error("Ошибка при отрисовке 3D вида", e)
-                screen.fill(BLACK)
-                font = pygame.font.Font(None, 36)
-                error_text = font.render("Ошибка отрисовки", True, RED)
-                screen.blit(error_text, (WIDTH//2 - 100, HEIGHT//2))
+            if keys[pygame.K_w] or keys[pygame.K_UP]:
+                move_x += cos_a * move_speed
+                move_y += sin_a * move_speed
 
-        def draw_minimap():
-            """Отрисовывает мини-карту и информацию."""
-            if not config['show_minimap']:
-                return
+            if keys[pygame.K_s] or keys[pygame.K_DOWN]:
+                move_x -= cos_a * move_speed
+                move_y -= sin_a * move_speed
 
-            try:
-                cell_size = MINIMAP_SIZE // config['map_size']
+            if keys[pygame.K_q]:
+                move_x += sin_a * move_speed
+                move_y -= cos_a * move_speed
 
-                # Фон мини-карты
-                pygame.draw.rect(
-                    screen, (40, 40, 40),
-                    (10, 10, MINIMAP_SIZE, MINIMAP_SIZE)
-                )
+            if keys[pygame.K_e]:
+                move_x -= sin_a * move_speed
+                move_y += cos_a * move_speed
 
-                for y in range(config['map_size']):
-                    for x in range(config['map_size']):
-                        rect = pygame.Rect(
-                            10 + x * cell_size,
-                            10 + y * cell_size,
-                            cell_size, cell_size
-                        )
-                        if maze[y][x] == 1:
-                            pygame.draw.rect(screen, WHITE, rect)
-                        else:
-                            pygame.draw.rect(screen, BLACK, rect)
-                        pygame.draw.rect(screen, GRAY, rect, 1)
-
-                # Рисуем выход зеленым цветом
-                exit_rect = pygame.Rect(
-                    10 + exit_x * cell_size,
-                    10 + exit_y * cell_size,
-                    cell_size, cell_size
-                )
-                pygame.draw.rect(screen, GREEN, exit_rect)
+            if keys[pygame.K_a] or keys[pygame.K_LEFT]:
+                player_angle -= ROTATION_SPEED
 
-                # Рисуем игрока
-                player_minimap_x = 10 + int(player_x * cell_size)
-                player_minimap_y = 10 + int(player_y * cell_size)
-                pygame.draw.circle(
-                    screen, RED, (player_minimap_x, player_minimap_y), 4
-                )
+            if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
+                player_angle += ROTATION_SPEED
 
-                # Рисуем направление взгляда
-                direction_x = (
-                    player_minimap_x + math.cos(player_angle) * 15
-                )
-                direction_y = (
-                    player_minimap_y + math.sin(player_angle) * 15
-                )
-                pygame.draw.line(
-                    screen, GREEN,
-                    (player_minimap_x, player_minimap_y),
-                    (direction_x, direction_y), 2
+            if move_x != 0 or move_y != 0:
+                new_x = player_x + move_x
+                new_y = player_y + move_y
+
+                can_move_both = (
+                    0 <= int(new_x) < map_size and
+                    0 <= int(new_y) < map_size and
+                    maze[int(new_y), int(new_x)] == 0
                 )
 
-                # Информация
-                font = pygame.font.Font(None, 24)
-                info_text = [
-                    f"Игрок: {player_name}",
-                    f"Сложность: {difficulty}",
-                    f"Время: {time.time() - start_time:.1f}с",
-                    f"Цель: ({exit_x}, {exit_y})"
-                ]
-
-                for i, text in enumerate(info_text):
-                    text_surface = font.render(text, True, WHITE)
-                    screen.blit(
-                        text_surface, (10, MINIMAP_SIZE + 20 + i * 25)
+                if can_move_both:
+                    player_x, player_y = new_x, new_y
+                else:
+                    can_move_x = (
+                        0 <= int(new_x) < map_size and
+                        0 <= int(player_y) < map_size and
+                        maze[int(player_y), int(new_x)] == 0
                     )
-            except Exception as e:
-                log_error("Ошибка при отрисовке мини-карты", e)
-
-        def handle_movement():
-            """Обрабатывает движение игрока."""
-            nonlocal player_x, player_y, player_angle
 
-            try:
-                keys = pygame.key.get_pressed()
-
-                move_x, move_y = 0, 0
-
-                if keys[pygame.K_w] or keys[pygame.K_UP]:
-                    move_x += math.cos(player_angle) * config['move_speed']
-                    move_y += math.sin(player_angle) * config['move_speed']
-
-                if keys[pygame.K_s] or keys[pygame.K_DOWN]:
-                    move_x -= math.cos(player_angle) * config['move_speed']
-                    move_y -= math.sin(player_angle) * config['move_speed']
-
-                if keys[pygame.K_q]:
-                    move_x += math.cos(
-                        player_angle - math.pi/2
-                    ) * config['move_speed']
-                    move_y += math.sin(
-                        player_angle - math.pi/2
-                    ) * config['move_speed']
-
-                if keys[pygame.K_e]:
-                    move_x += math.cos(
-                        player_angle + math.pi/2
-                    ) * config['move_speed']
-                    move_y += math.sin(
-                        player_angle + math.pi/2
-                    ) * config['move_speed']
-
-                if keys[pygame.K_a] or keys[pygame.K_LEFT]:
-                    player_angle -= ROTATION_SPEED
-
-                if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
-                    player_angle += ROTATION_SPEED
-
-                if move_x != 0 or move_y != 0:
-                    new_x = player_x + move_x
-                    new_y = player_y + move_y
-
-                    can_move_both = (
-                        0 <= int(new_x) < config['map_size'] and
-                        0 <= int(new_y) < config['map_size'] and
-                        maze[int(new_y)][int(new_x)] == 0
+                    can_move_y = (
+                        0 <= int(player_x) < map_size and
+                        0 <= int(new_y) < map_size and
+                        maze[int(new_y), int(player_x)] == 0
                     )
 
-                    if can_move_both:
-                        player_x, player_y = new_x, new_y
-                    else:
-                        can_move_x = (
-                            0 <= int(new_x) < config['map_size'] and
-                            0 <= int(player_y) < config['map_size'] and
-                            maze[int(player_y)][int(new_x)] == 0
-                        )
+                    if can_move_x:
+                        player_x = new_x
 
-                        can_move_y = (
-                            0 <= int(player_x) < config['map_size'] and
-                            0 <= int(new_y) < config['map_size'] and
-                            maze[int(new_y)][int(player_x)] == 0
-                        )
+                    if can_move_y:
+                        player_y = new_y
 
-                        if can_move_x:
-                            player_x = new_x
-
-                        if can_move_y:
-                            player_y = new_y
-            except Exception as e:
-                log_error("Ошибка при обработке движения", e)
+            return (player_x, player_y, player_angle) != previous_state
 
         # Основной игровой цикл
         running = True
         clock = pygame.time.Clock()
         game_completed = False
+        # 3D вид перерисовывается только после движения игрока
+        view_dirty = True
+        # Лучи считаются в отдельном потоке параллельно с главным циклом
+        raycaster = RaycastWorker(occupancy_grid)
 
         while running:
             try:
@@ -390,9 +683,12 @@ def run_game(difficulty, player_name):
                     elif event.type == pygame.KEYDOWN:
                         if event.key == pygame.K_ESCAPE:
                             running = False
+                    elif event.type == pygame.VIDEOEXPOSE:
+                        view_dirty = True
 
                 if not game_completed:
-                    handle_movement()
+                    if handle_movement():
+                        view_dirty = True
 
                     # Проверка достижения выхода
                     if int(player_x) == exit_x and int(player_y) == exit_y:
@@ -406,7 +702,6 @@ def run_game(difficulty, player_name):
                         # Показываем экран победы
                         screen.fill(BLACK)
                         font_large = pygame.font.Font(None, 72)
-                        font_medium = pygame.font.Font(None, 36)
 
                         win_text = font_large.render("ПОБЕДА!", True, GREEN)
                         time_text = font_medium.render(
@@ -462,33 +757,38 @@ def run_game(difficulty, player_name):
                                     running = False
 
                 if not game_completed:
-                    draw_3d_view()
-                    draw_minimap()
-
-                    # Отображение управления
-                    if config['show_minimap']:
-                        font = pygame.font.Font(None, 24)
-                        controls = [
-                            "W/UP - вперед",
-                            "S/DOWN - назад",
-                            "A/LEFT - поворот влево",
-                            "D/RIGHT - поворот вправо",
-                            "Q/E - стрейф",
-                            "ESC - выход в меню"
-                        ]
-
-                        for i, text in enumerate(controls):
-                            control_text = font.render(text, True, WHITE)
-                            screen.blit(control_text,
-                                        (WIDTH - 200, 20 + i * 25))
-
-                    pygame.display.flip()
+                    if view_dirty:
+                        raycaster.submit(player_x, player_y, player_angle)
+                        view_dirty = False
+
+                    # Пока новые расстояния не готовы, на экране прежний кадр
+                    distances = raycaster.poll()
+                    if distances is not None:
+                        draw_3d_view(distances)
+                        draw_minimap()
+
+                        # Отображение управления
+                        if show_minimap:
+                            for i, control_text in enumerate(
+                                    control_surfaces):
+                                screen.blit(control_text,
+                                            (WIDTH - 200, 20 + i * 25))
+
+                        pygame.display.flip()
+                    elif show_minimap:
+                        # Игрок стоит на месте: обновляем только HUD с таймером
+                        screen.blit(view_surface, hud_rect, hud_rect)
+                        draw_minimap()
+                        pygame.display.update(hud_rect)
+
                     clock.tick(60)
 
             except Exception as e:
                 log_error("Ошибка в основном игровом цикле", e)
                 running = False
 
+        raycaster.stop()
+
         if not game_completed:
             log_game_aborted(player_name, difficulty)
 
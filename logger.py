@@ -4,8 +4,11 @@
 Обеспечивает централизованное логирование ошибок и событий.
 """
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 from datetime import datetime
 
 # Создаем папку для логов если ее нет
@@ -13,6 +16,30 @@ LOG_DIR = "logs"
 if not os.path.exists(LOG_DIR):
     os.makedirs(LOG_DIR)
 
+# Размер буфера файла логов
+LOG_BUFFER_SIZE = 64 * 1024
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """Файловый обработчик, который не сбрасывает буфер после каждой записи.
+
+    Данные попадают на диск при заполнении буфера и при закрытии
+    обработчика.
+    """
+
+    def __init__(self, filename, encoding=None, buffer_size=LOG_BUFFER_SIZE):
+        """Инициализирует обработчик с заданным размером буфера."""
+        self.buffer_size = buffer_size
+        super().__init__(filename, encoding=encoding)
+
+    def _open(self):
+        """Открывает файл логов с увеличенным буфером."""
+        return open(self.baseFilename, self.mode,
+                    buffering=self.buffer_size, encoding=self.encoding)
+
+    def flush(self):
+        """Не сбрасывает буфер после каждой записи."""
+
 
 # Настройка логирования
 def setup_logger():
@@ -30,7 +57,7 @@ def setup_logger():
     log_filename = datetime.now().strftime("maze_game_%Y%m%d_%H%M%S.log")
     log_path = os.path.join(LOG_DIR, log_filename)
 
-    file_handler = logging.FileHandler(log_path, encoding='utf-8')
+    file_handler = BufferedFileHandler(log_path, encoding='utf-8')
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(formatter)
 
@@ -39,9 +66,19 @@ def setup_logger():
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
 
-    # Добавляем обработчики к логгеру
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Запись на диск и в консоль выполняется в отдельном потоке,
+    # а логгер только кладет записи в очередь
+    log_queue = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler,
+        respect_handler_level=True
+    )
+    listener.start()
+    # При выходе поток дописывает оставшиеся записи до закрытия файла
+    # в logging.shutdown
+    atexit.register(listener.stop)
 
     return logger
 
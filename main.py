@@ -39,12 +39,98 @@ stats_font = pygame.font.Font(None, 24)
 small_font = pygame.font.Font(None, 20)
 
 
+# Кэш отрисованных надписей: (шрифт, текст, цвет) -> поверхность
+_TEXT_CACHE = {}
+
+
+def cached_render(font, text, color):
+    """Возвращает поверхность с надписью, отрисовывая ее только один раз."""
+    key = (id(font), text, color)
+    surface = _TEXT_CACHE.get(key)
+    if surface is None:
+        surface = font.render(text, True, color).convert_alpha()
+        _TEXT_CACHE[key] = surface
+    return surface
+
+
+# fblits есть только в pygame-ce; в обычном pygame используем blits
+_HAS_FBLITS = hasattr(pygame.Surface, "fblits")
+
+
+def blit_batch(target, blit_seq):
+    """Выводит последовательность (поверхность, позиция) одним вызовом."""
+    if _HAS_FBLITS:
+        target.fblits(blit_seq)
+    else:
+        target.blits(blit_seq, doreturn=0)
+
+
+# Постоянные надписи меню отрисовываются один раз при запуске
+STATIC_SURFACES = {
+    "title_main": cached_render(title_font, "ЛАБИРИНТ", WHITE),
+    "name_label": cached_render(menu_font, "Введите имя:", WHITE),
+    "title_difficulty": cached_render(title_font, "ВЫБЕРИТЕ СЛОЖНОСТЬ", WHITE),
+    "title_stats": cached_render(title_font, "СТАТИСТИКА", WHITE),
+    "no_data": cached_render(menu_font, "Нет данных о прохождениях", GRAY),
+    "title_clear": cached_render(title_font, "ОЧИСТКА СТАТИСТИКИ", RED),
+    "clear_warning": cached_render(
+        menu_font, "Вы уверены, что хотите удалить всю статистику?", WHITE
+    ),
+}
+
+# Экраны меню
+SCREEN_MAIN, SCREEN_DIFFICULTY, SCREEN_STATISTICS, SCREEN_CLEAR = range(4)
+
+# Цвет названия сложности в таблице статистики
+DIFFICULTY_COLOR = {"Сложная": RED, "Средняя": YELLOW, "Легкая": GREEN}
+
+# Столбцы таблицы статистики
+STATS_X_POSITIONS = [50, 120, 220, 350, 480]
+STATS_HEADER_BLITS = [
+    (cached_render(stats_font, header, YELLOW), (x_pos, 100))
+    for header, x_pos in zip(
+        ["№", "Игрок", "Сложность", "Время", "Дата"], STATS_X_POSITIONS
+    )
+]
+
+# Описания сложностей: строки, цвет и левый край колонки
+DIFFICULTY_DESCRIPTIONS = [
+    ([
+        "ЛЕГКАЯ:",
+        "- Маленький лабиринт 15x15",
+        "- Есть мини-карта",
+        "- Высокая скорость движения",
+        "- Быстрое прохождение"
+    ], GREEN, WIDTH//4 - 120),
+    ([
+        "СРЕДНЯЯ:",
+        "- Средний лабиринт 21x21",
+        "- Есть мини-карта",
+        "- Стандартная скорость",
+        "- Нормальная сложность"
+    ], YELLOW, WIDTH//2 - 120),
+    ([
+        "СЛОЖНАЯ:",
+        "- Большой лабиринт 25x25",
+        "- Нет мини-карты",
+        "- Медленная скорость",
+        "- Сложная навигация"
+    ], RED, 3*WIDTH//4 - 120),
+]
+DIFFICULTY_DESC_BLITS = [
+    (cached_render(small_font, line, color), (x_pos, 150 + j * 30))
+    for lines, color, x_pos in DIFFICULTY_DESCRIPTIONS
+    for j, line in enumerate(lines)
+]
+
+
 def load_background():
     """Загружает фоновое изображение для меню."""
     try:
         background = pygame.image.load('maze.jpg')
         # Масштабируем изображение под размер окна
         background = pygame.transform.scale(background, (WIDTH, HEIGHT))
+        background = background.convert()
         log_info("Фоновое изображение успешно загружено")
         return background
     except (pygame.error, FileNotFoundError) as e:
@@ -58,22 +144,60 @@ def create_overlay_surface():
     try:
         overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
         overlay.fill((0, 0, 0, 180))  # Черный с прозрачностью
-        return overlay
+        return overlay.convert_alpha()
     except Exception as e:
         log_error("Ошибка создания overlay поверхности", e)
         return None
 
 
-def update_button_colors(buttons, mouse_pos):
-    """Обновляет цвета кнопок при наведении мыши."""
+def create_menu_background(background, overlay):
+    """Накладывает overlay на фон один раз, чтобы меню рисовали один слой."""
     try:
-        for button in buttons:
-            button.current_color = (
-                button.hover_color if button.is_hovered(mouse_pos)
-                else button.color
-            )
+        if background:
+            menu_background = background.copy()
+        else:
+            menu_background = pygame.Surface((WIDTH, HEIGHT))
+            menu_background.fill(BLACK)
+        if overlay:
+            menu_background.blit(overlay, (0, 0))
+        return menu_background.convert()
     except Exception as e:
-        log_error("Ошибка при обновлении цветов кнопок", e)
+        log_error("Ошибка подготовки фона меню", e)
+        return None
+
+
+def update_button_colors(buttons, mouse_pos):
+    """Обновляет цвета кнопок при наведении мыши.
+
+    Возвращает список кнопок, у которых изменился цвет.
+    """
+    changed = []
+    for button in buttons:
+        new_color = (
+            button.hover_color if button.is_hovered(mouse_pos)
+            else button.color
+        )
+        if new_color != button.current_color:
+            button.current_color = new_color
+            changed.append(button)
+    return changed
+
+
+def redraw_buttons(background, buttons):
+    """Перерисовывает поверх фона только области указанных кнопок.
+
+    Возвращает список прямоугольников для pygame.display.update().
+    """
+    dirty_rects = []
+    for button in buttons:
+        area = button.rect.inflate(4, 4)
+        if background:
+            screen.blit(background, area, area)
+        else:
+            screen.fill(BLACK, area)
+        button.draw(screen)
+        dirty_rects.append(area)
+    return dirty_rects
 
 
 class InputBox:
@@ -85,8 +209,13 @@ class InputBox:
             self.rect = pygame.Rect(x, y, w, h)
             self.color = GRAY
             self.text = text
-            self.txt_surface = input_font.render(text, True, WHITE)
+            self.txt_surface = input_font.render(
+                text, True, WHITE
+            ).convert_alpha()
             self.active = False
+            # Готовое изображение поля пересобирается только после изменений
+            self._composite = None
+            self._dirty = True
         except Exception as e:
             log_error("Ошибка инициализации InputBox", e)
 
@@ -96,6 +225,7 @@ class InputBox:
             if event.type == pygame.MOUSEBUTTONDOWN:
                 self.active = self.rect.collidepoint(event.pos)
                 self.color = BLUE if self.active else GRAY
+                self._dirty = True
             if event.type == pygame.KEYDOWN:
                 if self.active:
                     if event.key == pygame.K_RETURN:
@@ -104,8 +234,10 @@ class InputBox:
                         self.text = self.text[:-1]
                     else:
                         self.text += event.unicode
-                    self.txt_surface = input_font.render(self.text, True,
-                                                         WHITE)
+                    self.txt_surface = input_font.render(
+                        self.text, True, WHITE
+                    ).convert_alpha()
+                    self._dirty = True
             return False
         except Exception as e:
             log_error("Ошибка обработки события InputBox", e)
@@ -113,11 +245,24 @@ class InputBox:
 
     def draw(self, screen):
         """Отрисовывает поле ввода на экране."""
-        try:
-            screen.blit(self.txt_surface, (self.rect.x + 5, self.rect.y + 5))
-            pygame.draw.rect(screen, self.color, self.rect, 2)
-        except Exception as e:
-            log_error("Ошибка отрисовки InputBox", e)
+        if self._dirty:
+            self._rebuild_composite()
+        screen.blit(self._composite, self.rect.topleft)
+
+    def _rebuild_composite(self):
+        """Собирает текст и рамку поля в одну прозрачную поверхность."""
+        # Длинный текст выходит за рамку, поэтому поверхность может быть шире
+        width = max(self.rect.w, self.txt_surface.get_width() + 5)
+        height = max(self.rect.h, self.txt_surface.get_height() + 5)
+        self._composite = pygame.Surface(
+            (width, height), pygame.SRCALPHA
+        ).convert_alpha()
+        # BLEND_RGBA_MAX копирует пиксели текста вместе с альфой как есть
+        self._composite.blit(self.txt_surface, (5, 5),
+                             special_flags=pygame.BLEND_RGBA_MAX)
+        pygame.draw.rect(self._composite, self.color,
+                         pygame.Rect((0, 0), self.rect.size), 2)
+        self._dirty = False
 
 
 class Button:
@@ -138,36 +283,25 @@ class Button:
 
     def draw(self, screen):
         """Отрисовывает кнопку на экране."""
-        try:
-            pygame.draw.rect(screen, self.current_color, self.rect)
-            pygame.draw.rect(screen, WHITE, self.rect, 2)
-            text_surf = menu_font.render(self.text, True, self.text_color)
-            text_rect = text_surf.get_rect(center=self.rect.center)
-            screen.blit(text_surf, text_rect)
-        except Exception as e:
-            log_error("Ошибка отрисовки Button", e)
+        pygame.draw.rect(screen, self.current_color, self.rect)
+        pygame.draw.rect(screen, WHITE, self.rect, 2)
+        text_surf = cached_render(menu_font, self.text, self.text_color)
+        text_rect = text_surf.get_rect(center=self.rect.center)
+        screen.blit(text_surf, text_rect)
 
     def is_hovered(self, pos):
         """Проверяет, находится ли курсор над кнопкой."""
-        try:
-            return self.rect.collidepoint(pos)
-        except Exception as e:
-            log_error("Ошибка проверки hover кнопки", e)
-            return False
+        return self.rect.collidepoint(pos)
 
     def is_clicked(self, event):
         """Проверяет, была ли нажата кнопка."""
-        try:
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                return self.rect.collidepoint(event.pos)
-            return False
-        except Exception as e:
-            log_error("Ошибка проверки клика кнопки", e)
-            return False
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            return self.rect.collidepoint(event.pos)
+        return False
 
 
-def draw_main_menu(background, overlay, input_box, play_button, stats_button,
-                   clear_button, exit_button, mouse_pos):
+def draw_main_menu(background, input_box, play_button, stats_button,
+                   clear_button, exit_button):
     """Отрисовывает главное меню."""
     try:
         # Отрисовка фона
@@ -176,25 +310,16 @@ def draw_main_menu(background, overlay, input_box, play_button, stats_button,
         else:
             screen.fill(BLACK)
 
-        # Отрисовка полупрозрачного overlay для читаемости
-        if overlay:
-            screen.blit(overlay, (0, 0))
-
         # Заголовок
-        title_text = title_font.render("ЛАБИРИНТ", True, WHITE)
+        title_text = STATIC_SURFACES["title_main"]
         title_rect = title_text.get_rect(center=(WIDTH//2, 80))
         screen.blit(title_text, title_rect)
 
         # Поле ввода имени
-        name_label = menu_font.render("Введите имя:", True, WHITE)
+        name_label = STATIC_SURFACES["name_label"]
         screen.blit(name_label, (WIDTH//2 - 150, 150))
         input_box.draw(screen)
 
-        # Обновляем цвета кнопок
-        update_button_colors(
-            [play_button, stats_button, clear_button, exit_button], mouse_pos
-        )
-
         # Отрисовываем кнопки
         play_button.draw(screen)
         stats_button.draw(screen)
@@ -204,8 +329,8 @@ def draw_main_menu(background, overlay, input_box, play_button, stats_button,
         log_error("Ошибка отрисовки главного меню", e)
 
 
-def draw_difficulty_menu(background, overlay, back_button, easy_button,
-                         medium_button, hard_button, mouse_pos):
+def draw_difficulty_menu(background, back_button, easy_button,
+                         medium_button, hard_button):
     """Отрисовывает меню выбора сложности."""
     try:
         # Отрисовка фона
@@ -214,63 +339,13 @@ def draw_difficulty_menu(background, overlay, back_button, easy_button,
         else:
             screen.fill(BLACK)
 
-        # Отрисовка полупрозрачного overlay
-        if overlay:
-            screen.blit(overlay, (0, 0))
-
         # Заголовок
-        title_text = title_font.render("ВЫБЕРИТЕ СЛОЖНОСТЬ", True, WHITE)
+        title_text = STATIC_SURFACES["title_difficulty"]
         title_rect = title_text.get_rect(center=(WIDTH//2, 80))
         screen.blit(title_text, title_rect)
 
         # Описания сложностей
-        easy_desc = [
-            "ЛЕГКАЯ:",
-            "- Маленький лабиринт 15x15",
-            "- Есть мини-карта",
-            "- Высокая скорость движения",
-            "- Быстрое прохождение"
-        ]
-
-        medium_desc = [
-            "СРЕДНЯЯ:",
-            "- Средний лабиринт 21x21",
-            "- Есть мини-карта",
-            "- Стандартная скорость",
-            "- Нормальная сложность"
-        ]
-
-        hard_desc = [
-            "СЛОЖНАЯ:",
-            "- Большой лабиринт 25x25",
-            "- Нет мини-карты",
-            "- Медленная скорость",
-            "- Сложная навигация"
-        ]
-
-        # Отображение описаний
-        y_pos = 150
-        for line in easy_desc:
-            text = small_font.render(line, True, GREEN)
-            screen.blit(text, (WIDTH//4 - 120, y_pos))
-            y_pos += 30
-
-        y_pos = 150
-        for line in medium_desc:
-            text = small_font.render(line, True, YELLOW)
-            screen.blit(text, (WIDTH//2 - 120, y_pos))
-            y_pos += 30
-
-        y_pos = 150
-        for line in hard_desc:
-            text = small_font.render(line, True, RED)
-            screen.blit(text, (3*WIDTH//4 - 120, y_pos))
-            y_pos += 30
-
-        # Обновляем цвета кнопок
-        update_button_colors(
-            [back_button, easy_button, medium_button, hard_button], mouse_pos
-        )
+        blit_batch(screen, DIFFICULTY_DESC_BLITS)
 
         # Отрисовываем кнопки
         back_button.draw(screen)
@@ -281,97 +356,96 @@ def draw_difficulty_menu(background, overlay, back_button, easy_button,
         log_error("Ошибка отрисовки меню сложности", e)
 
 
-def draw_statistics_menu(background, overlay, back_button, mouse_pos,
-                         statistics=None):
-    """Отрисовывает экран статистики."""
-    try:
-        # Отрисовка фона
-        if background:
-            screen.blit(background, (0, 0))
-        else:
-            screen.fill(BLACK)
+class StatsScreen:
+    """Класс для готового к выводу содержимого экрана статистики."""
 
-        # Отрисовка полупрозрачного overlay
-        if overlay:
-            screen.blit(overlay, (0, 0))
+    def __init__(self):
+        """Инициализирует экран; таблица строится при первом rebuild()."""
+        self.blit_seq = None
 
-        # Заголовок
-        title_text = title_font.render("СТАТИСТИКА", True, WHITE)
-        title_rect = title_text.get_rect(center=(WIDTH//2, 50))
-        screen.blit(title_text, title_rect)
-
-        # Заголовки таблицы
-        headers = ["№", "Игрок", "Сложность", "Время", "Дата"]
-        x_positions = [50, 120, 220, 350, 480]
+    def rebuild(self, statistics):
+        """Собирает список (поверхность, позиция) для заданной статистики."""
+        try:
+            title_text = STATIC_SURFACES["title_stats"]
+            blit_seq = [
+                (title_text, title_text.get_rect(center=(WIDTH//2, 50)))
+            ]
 
-        for i, header in enumerate(headers):
-            text = stats_font.render(header, True, YELLOW)
-            screen.blit(text, (x_positions[i], 100))
+            # Заголовки таблицы
+            x0, x1, x2, x3, x4 = STATS_X_POSITIONS
+            blit_seq.extend(STATS_HEADER_BLITS)
 
-        # Используем переданную статистику или загружаем заново
-        if statistics is None:
-            statistics = get_sorted_statistics()
+            if not statistics:
+                no_data = STATIC_SURFACES["no_data"]
+                blit_seq.append((no_data, (WIDTH//2 - 180, 200)))
+                self.blit_seq = blit_seq
+                return
 
-        if not statistics:
-            no_data = menu_font.render(
-                "Нет данных о прохождениях", True, GRAY
-            )
-            screen.blit(no_data, (WIDTH//2 - 180, 200))
-        else:
             # Показываем топ-15 результатов
             for i, stat in enumerate(statistics[:15]):
                 y_pos = 130 + i * 25
+                # Строки, не помещающиеся в окно, не отрисовываем
+                if y_pos >= HEIGHT - 20:
+                    break
 
                 # Цвет в зависимости от сложности
-                if stat['difficulty'] == "Сложная":
-                    color = RED
-                elif stat['difficulty'] == "Средняя":
-                    color = YELLOW
-                else:
-                    color = GREEN
+                color = DIFFICULTY_COLOR.get(stat['difficulty'], GREEN)
 
                 # Номер
-                num_text = stats_font.render(str(i+1), True, WHITE)
-                screen.blit(num_text, (x_positions[0], y_pos))
-
-                # Игрок (обрезаем если слишком длинный)
-                player_name = (
-                    stat['player'][:12] + "..."
-                    if len(stat['player']) > 12
-                    else stat['player']
-                )
-                player_text = stats_font.render(player_name, True, WHITE)
-                screen.blit(player_text, (x_positions[1], y_pos))
+                num_text = cached_render(stats_font, str(i+1), WHITE)
+                blit_seq.append((num_text, (x0, y_pos)))
+
+                # Игрок (длинное имя обрезано еще при загрузке)
+                player_text = cached_render(stats_font, stat['_disp'], WHITE)
+                blit_seq.append((player_text, (x1, y_pos)))
 
                 # Сложность
-                diff_text = stats_font.render(stat['difficulty'], True, color)
-                screen.blit(diff_text, (x_positions[2], y_pos))
+                diff_text = cached_render(stats_font, stat['difficulty'],
+                                          color)
+                blit_seq.append((diff_text, (x2, y_pos)))
 
                 # Время
-                time_text = stats_font.render(f"{stat['time']:.2f}с", True,
-                                              WHITE)
-                screen.blit(time_text, (x_positions[3], y_pos))
+                time_text = cached_render(stats_font, f"{stat['time']:.2f}с",
+                                          WHITE)
+                blit_seq.append((time_text, (x3, y_pos)))
 
                 # Дата (только дата, без времени)
                 date_only = stat['date'].split(' ')[0]
-                date_text = stats_font.render(date_only, True, WHITE)
-                screen.blit(date_text, (x_positions[4], y_pos))
+                date_text = cached_render(stats_font, date_only, WHITE)
+                blit_seq.append((date_text, (x4, y_pos)))
 
             # Общая информация
-            total_text = small_font.render(
-                f"Всего записей: {len(statistics)}", True, GRAY
+            total_text = cached_render(
+                small_font, f"Всего записей: {len(statistics)}", GRAY
             )
-            screen.blit(total_text, (50, HEIGHT - 60))
+            blit_seq.append((total_text, (50, HEIGHT - 60)))
+            self.blit_seq = blit_seq
+        except Exception as e:
+            log_error("Ошибка подготовки таблицы статистики", e)
+            self.blit_seq = []
+
+
+def draw_statistics_menu(background, back_button, stats_screen):
+    """Отрисовывает экран статистики."""
+    try:
+        # Таблица еще не собрана - загружаем статистику
+        if stats_screen.blit_seq is None:
+            stats_screen.rebuild(get_sorted_statistics())
+
+        # Отрисовка фона
+        if background:
+            screen.blit(background, (0, 0))
+        else:
+            screen.fill(BLACK)
 
-        # Обновляем цвет кнопки назад
-        update_button_colors([back_button], mouse_pos)
+        blit_batch(screen, stats_screen.blit_seq)
         back_button.draw(screen)
     except Exception as e:
         log_error("Ошибка отрисовки экрана статистики", e)
 
 
-def draw_clear_confirmation(background, overlay, back_button, confirm_button,
-                            cancel_button, mouse_pos):
+def draw_clear_confirmation(background, back_button, confirm_button,
+                            cancel_button):
     """Отрисовывает экран подтверждения очистки статистики."""
     try:
         # Отрисовка фона
@@ -380,27 +454,16 @@ def draw_clear_confirmation(background, overlay, back_button, confirm_button,
         else:
             screen.fill(BLACK)
 
-        # Отрисовка полупрозрачного overlay
-        if overlay:
-            screen.blit(overlay, (0, 0))
-
         # Заголовок
-        title_text = title_font.render("ОЧИСТКА СТАТИСТИКИ", True, RED)
+        title_text = STATIC_SURFACES["title_clear"]
         title_rect = title_text.get_rect(center=(WIDTH//2, 150))
         screen.blit(title_text, title_rect)
 
         # Предупреждение
-        warning_text = menu_font.render(
-            "Вы уверены, что хотите удалить всю статистику?", True, WHITE
-        )
+        warning_text = STATIC_SURFACES["clear_warning"]
         warning_rect = warning_text.get_rect(center=(WIDTH//2, 250))
         screen.blit(warning_text, warning_rect)
 
-        # Обновляем цвета кнопок
-        update_button_colors(
-            [back_button, confirm_button, cancel_button], mouse_pos
-        )
-
         # Отрисовываем кнопки
         back_button.draw(screen)
         confirm_button.draw(screen)
@@ -414,9 +477,10 @@ def main():
     try:
         log_info("Запуск главного меню")
 
-        # Загрузка фона и создание overlay
-        background = load_background()
-        overlay = create_overlay_surface()
+        # Загрузка фона и создание overlay, сведенных в одну поверхность
+        background = create_menu_background(
+            load_background(), create_overlay_surface()
+        )
 
         # Создание элементов интерфейса
         input_box = InputBox(WIDTH//2 - 100, 200, 200, 40)
@@ -445,161 +509,188 @@ def main():
         )
         cancel_button = Button(WIDTH//2 + 20, 350, 200, 50, "ОТМЕНА")
 
-        # Состояния меню "main", "difficulty", "statistics", "clear_confirm"
-        current_screen = "main"
+        # Кнопки сложности: код уровня для run_game и название в статистике
+        difficulty_buttons = [
+            (easy_button, "easy", "Легкая"),
+            (medium_button, "medium", "Средняя"),
+            (hard_button, "hard", "Сложная"),
+        ]
+
+        # Кнопки, реагирующие на наведение, для каждого экрана
+        screen_buttons = {
+            SCREEN_MAIN: [play_button, stats_button, clear_button,
+                          exit_button],
+            SCREEN_DIFFICULTY: [back_button, easy_button, medium_button,
+                                hard_button],
+            SCREEN_STATISTICS: [back_button],
+            SCREEN_CLEAR: [back_button, confirm_button, cancel_button],
+        }
+
+        current_screen = SCREEN_MAIN
         player_name = ""
-        statistics_data = None  # Кэш для статистики
+        stats_screen = StatsScreen()  # Готовая к выводу таблица статистики
+        running = True
+
+        def handle_main_event(event):
+            """Обрабатывает событие главного меню."""
+            nonlocal current_screen, player_name, running
+            if input_box.handle_event(event):
+                player_name = input_box.text
+
+            if play_button.is_clicked(event):
+                if input_box.text.strip():
+                    player_name = input_box.text.strip()
+                    current_screen = SCREEN_DIFFICULTY
+                    log_screen_transition(
+                        "main", "difficulty", f"Игрок: {player_name}"
+                    )
+                else:
+                    log_warning("Попытка начать игру без имени игрока")
+
+            if stats_button.is_clicked(event):
+                current_screen = SCREEN_STATISTICS
+                log_screen_transition("main", "statistics")
+                log_statistics_viewed()
+                # Загружаем статистику и собираем таблицу один раз при
+                # переходе: пока экран открыт, она измениться не может
+                statistics = get_sorted_statistics()
+                stats_screen.rebuild(statistics)
+                log_statistics_loaded(len(statistics))
+
+            if clear_button.is_clicked(event):
+                current_screen = SCREEN_CLEAR
+                log_screen_transition("main", "clear_confirmation")
+
+            if exit_button.is_clicked(event):
+                log_info("Выход из приложения по кнопке")
+                running = False
+
+        def handle_difficulty_event(event):
+            """Обрабатывает событие меню выбора сложности."""
+            nonlocal current_screen
+            if back_button.is_clicked(event):
+                current_screen = SCREEN_MAIN
+                log_screen_transition("difficulty", "main")
+
+            for button, difficulty, label in difficulty_buttons:
+                if not button.is_clicked(event):
+                    continue
+                log_info(f"Запуск игры: {player_name}, сложность: {label}")
+                completion_time = run_game(difficulty, player_name)
+                if completion_time > 0:
+                    add_statistic(player_name, completion_time, label)
+                    log_info(
+                        f"Статистика сохранена: {player_name}, "
+                        f"{label}, {completion_time:.2f}с"
+                    )
+                current_screen = SCREEN_MAIN
+                log_screen_transition("difficulty", "main", "после игры")
+                break
+
+        def handle_statistics_event(event):
+            """Обрабатывает событие экрана статистики."""
+            nonlocal current_screen
+            if back_button.is_clicked(event):
+                current_screen = SCREEN_MAIN
+                log_screen_transition("statistics", "main")
+
+        def handle_clear_event(event):
+            """Обрабатывает событие экрана подтверждения очистки."""
+            nonlocal current_screen
+            if back_button.is_clicked(event):
+                current_screen = SCREEN_MAIN
+                log_screen_transition("clear_confirmation", "main")
+
+            if confirm_button.is_clicked(event):
+                if clear_statistics():
+                    log_statistics_cleared()
+                    # Надписи строк таблицы больше не нужны
+                    _TEXT_CACHE.clear()
+                    stats_screen.rebuild([])
+                else:
+                    log_error("Не удалось очистить статистику")
+                current_screen = SCREEN_MAIN
+                log_screen_transition("clear_confirmation", "main")
+
+            if cancel_button.is_clicked(event):
+                current_screen = SCREEN_MAIN
+                log_screen_transition("clear_confirmation", "main", "отмена")
+
+        screen_event_handlers = {
+            SCREEN_MAIN: handle_main_event,
+            SCREEN_DIFFICULTY: handle_difficulty_event,
+            SCREEN_STATISTICS: handle_statistics_event,
+            SCREEN_CLEAR: handle_clear_event,
+        }
+
+        screen_drawers = {
+            SCREEN_MAIN: lambda: draw_main_menu(
+                background, input_box, play_button, stats_button,
+                clear_button, exit_button
+            ),
+            SCREEN_DIFFICULTY: lambda: draw_difficulty_menu(
+                background, back_button, easy_button, medium_button,
+                hard_button
+            ),
+            SCREEN_STATISTICS: lambda: draw_statistics_menu(
+                background, back_button, stats_screen
+            ),
+            SCREEN_CLEAR: lambda: draw_clear_confirmation(
+                background, back_button, confirm_button, cancel_button
+            ),
+        }
 
         clock = pygame.time.Clock()
 
-        while True:
+        # Весь экран перерисовывается только после событий
+        dirty = True
+        last_mouse_pos = None
+        last_screen = None
+
+        while running:
             try:
                 mouse_pos = pygame.mouse.get_pos()
 
-                for event in pygame.event.get():
+                # poll() не создает список событий на каждом кадре
+                while (event := pygame.event.poll()).type != pygame.NOEVENT:
+                    # Движение мыши перерисовывает лишь подсвеченные кнопки
+                    if event.type != pygame.MOUSEMOTION:
+                        dirty = True
+
                     if event.type == pygame.QUIT:
                         log_info("Выход из приложения")
-                        pygame.quit()
-                        sys.exit()
-
-                    if current_screen == "main":
-                        if input_box.handle_event(event):
-                            player_name = input_box.text
-
-                        if play_button.is_clicked(event):
-                            if input_box.text.strip():
-                                player_name = input_box.text.strip()
-                                current_screen = "difficulty"
-                                log_screen_transition(
-                                    "main", "difficulty",
-                                    f"Игрок: {player_name}"
-                                )
-                            else:
-                                log_warning(
-                                    "Попытка начать игру без имени игрока"
-                                )
-
-                        if stats_button.is_clicked(event):
-                            current_screen = "statistics"
-                            log_screen_transition("main", "statistics")
-                            log_statistics_viewed()
-                            # Загружаем статистику один раз при переходе
-                            statistics_data = get_sorted_statistics()
-                            log_statistics_loaded(len(statistics_data))
-
-                        if clear_button.is_clicked(event):
-                            current_screen = "clear_confirm"
-                            log_screen_transition("main",
-                                                  "clear_confirmation")
-
-                        if exit_button.is_clicked(event):
-                            log_info("Выход из приложения по кнопке")
-                            pygame.quit()
-                            sys.exit()
-
-                    elif current_screen == "difficulty":
-                        if back_button.is_clicked(event):
-                            current_screen = "main"
-                            log_screen_transition("difficulty", "main")
-
-                        if easy_button.is_clicked(event):
-                            log_info(
-                                f"Запуск игры: {player_name}, "
-                                f"сложность: Легкая"
-                            )
-                            completion_time = run_game("easy", player_name)
-                            if completion_time > 0:
-                                add_statistic(player_name, completion_time,
-                                              "Легкая")
-                                log_info(
-                                    f"Статистика сохранена: {player_name}, "
-                                    f"Легкая, {completion_time:.2f}с"
-                                )
-                            current_screen = "main"
-                            log_screen_transition("difficulty", "main",
-                                                  "после игры")
-
-                        if medium_button.is_clicked(event):
-                            log_info(
-                                f"Запуск игры: {player_name}, "
-                                f"сложность: Средняя"
-                            )
-                            completion_time = run_game("medium", player_name)
-                            if completion_time > 0:
-                                add_statistic(player_name, completion_time,
-                                              "Средняя")
-                                log_info(
-                                    f"Статистика сохранена: {player_name}, "
-                                    f"Средняя, {completion_time:.2f}с"
-                                )
-                            current_screen = "main"
-                            log_screen_transition("difficulty", "main",
-                                                  "после игры")
-
-                        if hard_button.is_clicked(event):
-                            log_info(
-                                f"Запуск игры: {player_name}, "
-                                f"сложность: Сложная"
-                            )
-                            completion_time = run_game("hard", player_name)
-                            if completion_time > 0:
-                                add_statistic(player_name, completion_time,
-                                              "Сложная")
-                                log_info(
-                                    f"Статистика сохранена: {player_name}, "
-                                    f"Сложная, {completion_time:.2f}с"
-                                )
-                            current_screen = "main"
-                            log_screen_transition("difficulty", "main",
-                                                  "после игры")
-
-                    elif current_screen == "statistics":
-                        if back_button.is_clicked(event):
-                            current_screen = "main"
-                            log_screen_transition("statistics", "main")
-
-                    elif current_screen == "clear_confirm":
-                        if back_button.is_clicked(event):
-                            current_screen = "main"
-                            log_screen_transition("clear_confirmation", "main")
-
-                        if confirm_button.is_clicked(event):
-                            if clear_statistics():
-                                log_statistics_cleared()
-                                statistics_data = []  # Очищаем кэш
-                            else:
-                                log_error("Не удалось очистить статистику")
-                            current_screen = "main"
-                            log_screen_transition("clear_confirmation", "main")
-
-                        if cancel_button.is_clicked(event):
-                            current_screen = "main"
-                            log_screen_transition("clear_confirmation",
-                                                  "main", "отмена")
-
-                # Отрисовка текущего экрана
-                if current_screen == "main":
-                    draw_main_menu(
-                        background, overlay, input_box, play_button,
-                        stats_button, clear_button, exit_button, mouse_pos
-                    )
-                elif current_screen == "difficulty":
-                    draw_difficulty_menu(
-                        background, overlay, back_button, easy_button,
-                        medium_button, hard_button, mouse_pos
+                        running = False
+                        break
+
+                    screen_event_handlers[current_screen](event)
+                    if not running:
+                        break
+
+                if not running:
+                    break
+
+                # Подсветку пересчитываем, только если мышь сдвинулась или
+                # сменился экран (кнопка "НАЗАД" общая для нескольких экранов)
+                hover_changed = []
+                if (mouse_pos != last_mouse_pos
+                        or current_screen != last_screen):
+                    last_mouse_pos = mouse_pos
+                    last_screen = current_screen
+                    hover_changed = update_button_colors(
+                        screen_buttons[current_screen], mouse_pos
                     )
-                elif current_screen == "statistics":
-                    draw_statistics_menu(
-                        background, overlay, back_button, mouse_pos,
-                        statistics_data
-                    )
-                elif current_screen == "clear_confirm":
-                    draw_clear_confirmation(
-                        background, overlay, back_button,
-                        confirm_button, cancel_button, mouse_pos
+
+                # Отрисовка текущего экрана целиком или только кнопок,
+                # сменивших подсветку
+                if dirty:
+                    screen_drawers[current_screen]()
+                    pygame.display.flip()
+                    dirty = False
+                elif hover_changed:
+                    pygame.display.update(
+                        redraw_buttons(background, hover_changed)
                     )
 
-                pygame.display.flip()
                 clock.tick(60)
 
             except Exception as e:
@@ -7,25 +7,106 @@
 import json
 import os
 import datetime
+from operator import itemgetter
 from logger import log_error, log_info, log_warning
 
-STATS_FILE = "game_statistics.json"
+# orjson необязателен: без него используется стандартный модуль json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Одна запись на строку (JSON Lines), чтобы новые результаты дописывались
+STATS_FILE = "game_statistics.jsonl"
+# Файл старого формата (единый JSON-массив), переносится при первом чтении
+LEGACY_STATS_FILE = "game_statistics.json"
 
 # Порядок сложностей для сортировки (от самой сложной к самой легкой)
 DIFFICULTY_ORDER = {"Сложная": 3, "Средняя": 2, "Легкая": 1}
 
+# Сколько символов имени игрока показывать в таблице
+PLAYER_NAME_MAX_LEN = 12
+
+# Кэш разобранного файла статистики, привязанный ко времени его изменения
+_cache = {"mtime": None, "data": None}
+
+
+def _dumps(record):
+    """Сериализует запись в одну строку JSON в байтах."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(record)
+    return json.dumps(record, ensure_ascii=False).encode('utf-8')
+
+
+def _loads(data):
+    """Разбирает JSON из байтов."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _add_cached_fields(record):
+    """Запоминает в записи ключ сортировки и имя для отображения."""
+    record['_sort_key'] = (
+        -DIFFICULTY_ORDER.get(record['difficulty'], 0), record['time']
+    )
+    player = record['player']
+    record['_disp'] = (
+        player[:PLAYER_NAME_MAX_LEN] + "..."
+        if len(player) > PLAYER_NAME_MAX_LEN
+        else player
+    )
+    return record
+
+
+def _strip_private(record):
+    """Возвращает запись без служебных полей (начинающихся с '_')."""
+    return {k: v for k, v in record.items() if not k.startswith('_')}
+
+
+def _migrate_legacy_statistics():
+    """Переносит статистику из старого JSON-файла в формат JSON Lines."""
+    if not os.path.exists(LEGACY_STATS_FILE) or os.path.exists(STATS_FILE):
+        return
+
+    try:
+        with open(LEGACY_STATS_FILE, 'rb') as f:
+            statistics = _loads(f.read())
+        if save_statistics(statistics):
+            os.remove(LEGACY_STATS_FILE)
+            log_info(
+                f"Статистика перенесена из {LEGACY_STATS_FILE} "
+                f"в {STATS_FILE}"
+            )
+    except Exception as e:
+        log_error("Ошибка переноса статистики из старого формата", e)
+
 
 def load_statistics():
     """Загружает статистику из файла."""
     try:
-        if not os.path.exists(STATS_FILE):
+        _migrate_legacy_statistics()
+
+        try:
+            mtime = os.stat(STATS_FILE).st_mtime_ns
+        except FileNotFoundError:
             log_info("Файл статистики не найден, создается новый")
             return []
 
-        with open(STATS_FILE, 'r', encoding='utf-8') as f:
-            statistics = json.load(f)
+        # Файл не менялся с прошлого чтения - отдаем копию кэша
+        if mtime == _cache["mtime"]:
+            return list(_cache["data"])
+
+        with open(STATS_FILE, 'rb') as f:
+            statistics = [
+                _add_cached_fields(_loads(line)) for line in f if line.strip()
+            ]
             log_info(f"Статистика загружена: {len(statistics)} записей")
-            return statistics
+
+        _cache["mtime"] = mtime
+        _cache["data"] = statistics
+        return list(statistics)
 
     except (json.JSONDecodeError, FileNotFoundError) as e:
         log_error("Ошибка загрузки статистики", e)
@@ -38,8 +119,11 @@ def load_statistics():
 def save_statistics(statistics):
     """Сохраняет статистику в файл."""
     try:
-        with open(STATS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(statistics, f, ensure_ascii=False, indent=2)
+        with open(STATS_FILE, 'wb') as f:
+            f.writelines(
+                _dumps(_strip_private(stat)) + b"\n" for stat in statistics
+            )
+        _cache["mtime"] = None
         log_info(f"Статистика сохранена: {len(statistics)} записей")
         return True
     except Exception as e:
@@ -47,10 +131,23 @@ def save_statistics(statistics):
         return False
 
 
+def _append_statistic(record):
+    """Дописывает одну запись в конец файла статистики."""
+    try:
+        with open(STATS_FILE, 'ab') as f:
+            f.write(_dumps(record) + b"\n")
+        _cache["mtime"] = None
+        return True
+    except Exception as e:
+        log_error("Ошибка записи в файл статистики", e)
+        return False
+
+
 def add_statistic(player_name, completion_time, difficulty):
     """Добавляет запись в статистику и сохраняет в файл."""
     try:
-        statistics = load_statistics()
+        # Старый файл нужно перенести до того, как появится новый
+        _migrate_legacy_statistics()
 
         current_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
         new_record = {
@@ -60,9 +157,7 @@ def add_statistic(player_name, completion_time, difficulty):
             'difficulty': difficulty
         }
 
-        statistics.append(new_record)
-
-        if save_statistics(statistics):
+        if _append_statistic(new_record):
             log_info(
                 f"Добавлена запись: {player_name}, {difficulty}, "
                 f"{completion_time:.2f}с"
@@ -86,8 +181,7 @@ def get_sorted_statistics():
         # затем по времени
         sorted_stats = sorted(
             statistics,
-            key=lambda x: (-DIFFICULTY_ORDER.get(x['difficulty'], 0),
-                           x['time'])
+            key=itemgetter('_sort_key')
         )
 
         log_info(f"Статистика отсортирована: {len(sorted_stats)} записей")
@@ -101,6 +195,9 @@ def get_sorted_statistics():
 def clear_statistics():
     """Очищает всю статистику."""
     try:
+        _cache["mtime"] = None
+        if os.path.exists(LEGACY_STATS_FILE):
+            os.remove(LEGACY_STATS_FILE)
         if os.path.exists(STATS_FILE):
             os.remove(STATS_FILE)
             log_info("Статистика полностью очищена")
@@ -124,8 +221,7 @@ def get_player_statistics(player_name):
         # Сортируем по сложности и времени
         sorted_stats = sorted(
             player_stats,
-            key=lambda x: (-DIFFICULTY_ORDER.get(x['difficulty'], 0),
-                           x['time'])
+            key=itemgetter('_sort_key')
         )
 
         log_info(
@@ -148,7 +244,7 @@ def get_difficulty_statistics(difficulty):
         ]
 
         # Сортируем по времени
-        sorted_stats = sorted(diff_stats, key=lambda x: x['time'])
+        sorted_stats = sorted(diff_stats, key=itemgetter('time'))
 
         log_info(
             f"Загружена статистика сложности {difficulty}: "